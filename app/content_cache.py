@@ -0,0 +1,72 @@
+"""Per-process cache of AppContent, which is read on every landing/about page view but edited rarely.
+
+ORM writes evict the keys they touched (old and new, for renames) once their transaction ends, so no reader can
+re-cache a value that is about to change or be rolled back. Changes made elsewhere (another worker, a bulk UPDATE)
+show up once the entry expires.
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Mapper, Session as OrmSession, SessionTransaction, object_session
+from sqlalchemy.orm.attributes import get_history
+from sqlmodel import Session, col
+
+from app.models import AppContent
+
+CONTENT_TTL = 60.0  # seconds
+CONTENT_CACHE_SIZE = 1024
+
+_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+_WRITTEN_KEYS = "app_content_keys"  # session.info entry: keys written in the current transaction
+
+
+def cached_content(session: Session, key: str, now: Optional[float] = None) -> Optional[str]:
+    """Active content for key, served from the cache for up to CONTENT_TTL seconds.
+
+    now is a time.monotonic() reading and defaults to the current one.
+    """
+    if now is None:
+        now = time.monotonic()
+    hit = _cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    content = session.execute(
+        select(col(AppContent.content)).where(col(AppContent.key) == key, col(AppContent.is_active).is_(True))
+    ).scalar()
+    if len(_cache) >= CONTENT_CACHE_SIZE:
+        _cache.clear()
+    _cache[key] = (now + CONTENT_TTL, content)
+    return content
+
+
+def clear_content_cache() -> None:
+    _cache.clear()
+
+
+@event.listens_for(AppContent.key, "set", active_history=True)
+def _load_old_key(target: AppContent, value: str, oldvalue: Any, initiator: Any) -> None:
+    """Registered for active_history: a rename loads the old key first, even on an expired instance, so
+    _note_written_key() finds it in the attribute history."""
+
+
+@event.listens_for(AppContent, "after_insert")
+@event.listens_for(AppContent, "after_update")
+@event.listens_for(AppContent, "after_delete")
+def _note_written_key(mapper: Mapper[Any], connection: Any, target: AppContent) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    added, unchanged, deleted = get_history(target, "key")
+    session.info.setdefault(_WRITTEN_KEYS, set()).update(added or (), unchanged or (), deleted or ())
+    # Only sessions that wrote AppContent get the end-of-transaction hook, not every session in the app
+    if not event.contains(session, "after_transaction_end", _evict_written_keys):
+        event.listen(session, "after_transaction_end", _evict_written_keys)
+
+
+def _evict_written_keys(session: OrmSession, transaction: SessionTransaction) -> None:
+    # Commit, rollback and close all end the outermost transaction; savepoints ending inside it don't count
+    if transaction.parent is None:
+        for key in session.info.pop(_WRITTEN_KEYS, ()):
+            _cache.pop(key, None)
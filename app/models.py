@@ -1,123 +1,441 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from decimal import Decimal
-from enum import Enum
+from sqlmodel import SQLModel, Field, Relationship, Column, Index, Session, col
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    ColumnElement,
+    DDL,
+    ForeignKeyConstraint,
+    Row,
+    Select,
+    SmallInteger,
+    Text,
+    TypeDecorator,
+    UniqueConstraint,
+    and_,
+    event,
+    func,
+    insert,
+    select as sa_select,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql.dml import ReturningInsert
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.orm.attributes import manager_of_class
+from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler, GetJsonSchemaHandler, field_validator
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema, PydanticUndefined, core_schema
+from abc import abstractmethod
+from copy import deepcopy
+from dataclasses import asdict, dataclass
+from functools import partial
+from datetime import UTC, datetime, timedelta
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    Self,
+    Sequence,
+    Tuple,
+    get_args,
+)
+from decimal import ROUND_HALF_UP, Decimal
+from enum import Enum, IntEnum
+import re
+import sys
+
+# Compiled once at import; the validators below only call the bound fullmatch.
+_EMAIL_MATCH = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+").fullmatch
+
+
+def _check_email(value: str) -> str:
+    if _EMAIL_MATCH(value) is None:
+        raise ValueError("Invalid email address")
+    return value
+
+
+def utcnow() -> datetime:
+    """Current naive UTC time."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+# created_at/updated_at are stamped by the database: server default on INSERT (read back through RETURNING),
+# rendered inline on UPDATE. Same naive-UTC convention as utcnow(); now() is the transaction start, so every
+# row written in one transaction gets the same value. The fields are Optional because they stay None on a new
+# instance until it is flushed; the columns themselves are NOT NULL.
+_DB_UTCNOW = func.timezone("UTC", func.now())
+
+
+# Money is stored as integer cents; Decimal only appears at the form/display boundary.
+def to_cents(amount: Optional[Decimal]) -> Optional[int]:
+    return None if amount is None else int((amount * 100).to_integral_value(ROUND_HALF_UP))
+
+
+def from_cents(cents: Optional[int]) -> Optional[Decimal]:
+    return None if cents is None else Decimal(cents) / 100
 
 
 # Enums for various statuses
-class UserRole(str, Enum):
-    ADMIN = "admin"
-    HEAD_LAB = "head_lab"
-    LABORAN = "laboran"
-    LECTURER = "lecturer"
-    STUDENT = "student"
 
 
-class UserStatus(str, Enum):
-    PENDING = "pending"
-    VERIFIED = "verified"
-    SUSPENDED = "suspended"
+class LabelEnum(IntEnum):
+    """Int-backed enum that also parses its lower-case label, e.g. "head_lab" -> HEAD_LAB.
 
+    Stored as its int value in a SMALLINT column (see LabelEnumType); JSON dumps use the label.
+    """
 
-class EquipmentStatus(str, Enum):
-    AVAILABLE = "available"
-    IN_USE = "in_use"
-    MAINTENANCE = "maintenance"
-    DAMAGED = "damaged"
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["LabelEnum"]:
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
 
-class BorrowingStatus(str, Enum):
-    PENDING = "pending"
-    APPROVED_LABORAN = "approved_laboran"
-    APPROVED_HEAD = "approved_head"
-    CHECKED_OUT = "checked_out"
-    CHECKED_IN = "checked_in"
-    OVERDUE = "overdue"
-    CANCELLED = "cancelled"
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> CoreSchema:
+        # Labels are parsed and dumped with one probe of a prebuilt dict each, instead of going
+        # through Enum.__call__/_missing_ and the label property for every value.
+        parse = {sys.intern(member.label): member for member in cls}
+        dump = {member: member.label for member in cls}
+        return core_schema.no_info_before_validator_function(
+            partial(_parse_label, parse),
+            handler(source),
+            serialization=core_schema.plain_serializer_function_ser_schema(dump.__getitem__, when_used="json"),
+        )
 
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        return {"title": cls.__name__, "type": "string", "enum": [member.label for member in cls]}
 
-class NotificationStatus(str, Enum):
-    UNREAD = "unread"
-    READ = "read"
 
+def _parse_label(lookup: Mapping[str, Any], value: Any) -> Any:
+    return lookup.get(value, value) if isinstance(value, str) else value
 
-class NotificationType(str, Enum):
-    USER_REGISTRATION = "user_registration"
-    USER_VERIFICATION = "user_verification"
-    BORROWING_REQUEST = "borrowing_request"
-    BORROWING_APPROVED = "borrowing_approved"
-    BORROWING_REJECTED = "borrowing_rejected"
-    EQUIPMENT_DUE = "equipment_due"
-    EQUIPMENT_OVERDUE = "equipment_overdue"
-    EQUIPMENT_RETURNED = "equipment_returned"
-    EQUIPMENT_DAMAGED = "equipment_damaged"
-    MAINTENANCE_SCHEDULED = "maintenance_scheduled"
 
+class LabelEnumType(TypeDecorator[LabelEnum]):
+    """SMALLINT column holding a LabelEnum's int value."""
 
-class MaintenanceType(str, Enum):
-    PREVENTIVE = "preventive"
-    CORRECTIVE = "corrective"
-    EMERGENCY = "emergency"
+    impl = SmallInteger
+    cache_ok = True
 
+    def __init__(self, enum_cls: type[LabelEnum]) -> None:
+        super().__init__()
+        self.enum_cls = enum_cls
 
-class MaintenanceStatus(str, Enum):
-    SCHEDULED = "scheduled"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[int]:
+        return None if value is None else int(self.enum_cls(value))
 
+    def process_result_value(self, value: Optional[int], dialect: Dialect) -> Optional[LabelEnum]:
+        return None if value is None else self.enum_cls(value)
 
-class AuditAction(str, Enum):
-    CREATE = "create"
-    UPDATE = "update"
-    DELETE = "delete"
-    LOGIN = "login"
-    LOGOUT = "logout"
-    APPROVE = "approve"
-    REJECT = "reject"
-    CHECKOUT = "checkout"
-    CHECKIN = "checkin"
+
+def _label_enum_of(annotation: Any) -> Optional[type[LabelEnum]]:
+    for candidate in (annotation, *get_args(annotation)):  # unwraps Optional[...]
+        if isinstance(candidate, type) and issubclass(candidate, LabelEnum):
+            return candidate
+    return None
+
+
+class UserRole(LabelEnum):
+    ADMIN = 1
+    HEAD_LAB = 2
+    LABORAN = 3
+    LECTURER = 4
+    STUDENT = 5
+
+
+class UserStatus(LabelEnum):
+    PENDING = 1
+    VERIFIED = 2
+    SUSPENDED = 3
+
+
+class EquipmentStatus(LabelEnum):
+    AVAILABLE = 1
+    IN_USE = 2
+    MAINTENANCE = 3
+    DAMAGED = 4
+
+
+class BorrowingStatus(LabelEnum):
+    PENDING = 1
+    APPROVED_LABORAN = 2
+    APPROVED_HEAD = 3
+    CHECKED_OUT = 4
+    CHECKED_IN = 5
+    OVERDUE = 6
+    CANCELLED = 7
+
+
+class NotificationStatus(LabelEnum):
+    UNREAD = 1
+    READ = 2
+
+
+class NotificationType(LabelEnum):
+    USER_REGISTRATION = 1
+    USER_VERIFICATION = 2
+    BORROWING_REQUEST = 3
+    BORROWING_APPROVED = 4
+    BORROWING_REJECTED = 5
+    EQUIPMENT_DUE = 6
+    EQUIPMENT_OVERDUE = 7
+    EQUIPMENT_RETURNED = 8
+    EQUIPMENT_DAMAGED = 9
+    MAINTENANCE_SCHEDULED = 10
+
+
+class MaintenanceType(LabelEnum):
+    PREVENTIVE = 1
+    CORRECTIVE = 2
+    EMERGENCY = 3
+
+
+class MaintenanceStatus(LabelEnum):
+    SCHEDULED = 1
+    IN_PROGRESS = 2
+    COMPLETED = 3
+    CANCELLED = 4
+
+
+class AuditAction(LabelEnum):
+    CREATE = 1
+    UPDATE = 2
+    DELETE = 3
+    LOGIN = 4
+    LOGOUT = 5
+    APPROVE = 6
+    REJECT = 7
+    CHECKOUT = 8
+    CHECKIN = 9
+
+
+class LabMemberRole(LabelEnum):
+    HEAD = 1
+    LABORAN = 2
+    MEMBER = 3
+
+
+class EquipmentCondition(LabelEnum):
+    GOOD = 1
+    FAIR = 2
+    POOR = 3
+
+
+class HelpTicketStatus(LabelEnum):
+    OPEN = 1
+    IN_PROGRESS = 2
+    RESOLVED = 3
+    CLOSED = 4
+
+
+class HelpTicketPriority(LabelEnum):
+    LOW = 1
+    NORMAL = 2
+    HIGH = 3
+    URGENT = 4
+
+
+class HelpTicketCategory(LabelEnum):
+    GENERAL = 1
+    PASSWORD_RESET = 2
+    ACCOUNT = 3
+    TECHNICAL = 4
 
 
 # Persistent models (stored in database)
 
 
-class User(SQLModel, table=True):
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, Decimal)
+_ROW_LOADERS: Dict[type, Callable[[Mapping[str, Any]], Any]] = {}
+
+
+def _compile_row_loader(cls: type[SQLModel]) -> Callable[[Mapping[str, Any]], Any]:
+    """Generate a loader that writes a row's columns straight into a new instance's __dict__.
+
+    This is what SQLAlchemy itself does when hydrating query results: the instance gets its
+    _sa_instance_state from the class manager, and no Pydantic validation or per-attribute
+    instrumentation events run.
+    """
+    configure_mappers()  # normally triggered by the first __init__, which the loader bypasses
+    namespace: Dict[str, Any] = {
+        "new_instance": manager_of_class(cls).new_instance,
+        "field_names": frozenset(cls.model_fields),
+        "deepcopy": deepcopy,
+        "setattr_": object.__setattr__,
+    }
+    lines = ["def load(row):", "    self = new_instance()", "    d = self.__dict__"]
+    for i, (name, field) in enumerate(cls.model_fields.items()):
+        if field.is_required():
+            lines.append(f"    if {name!r} in row: d[{name!r}] = row[{name!r}]")
+        elif field.default_factory is not None:
+            namespace[f"factory_{i}"] = field.default_factory
+            lines.append(f"    d[{name!r}] = row[{name!r}] if {name!r} in row else factory_{i}()")
+        elif isinstance(field.default, _IMMUTABLE_DEFAULTS + (Enum,)):
+            namespace[f"default_{i}"] = field.default
+            lines.append(f"    d[{name!r}] = row.get({name!r}, default_{i})")
+        else:
+            namespace[f"default_{i}"] = field.default
+            lines.append(f"    d[{name!r}] = row[{name!r}] if {name!r} in row else deepcopy(default_{i})")
+    lines.append("    setattr_(self, '__pydantic_fields_set__', row.keys() & field_names)")
+    lines.append("    return self")
+    exec("\n".join(lines), namespace)
+    return namespace["load"]
+
+
+class TableModel(SQLModel):
+    """Common base for all table models."""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Runs before SQLModel builds the columns; without it every LabelEnum field becomes a native ENUM of names
+        for field in cls.model_fields.values():
+            enum_cls = _label_enum_of(field.annotation)
+            if enum_cls is not None and getattr(field, "sa_type", PydanticUndefined) is PydanticUndefined:
+                field.sa_type = LabelEnumType(enum_cls)  # type: ignore[attr-defined]
+
+    # Fields of the *Create/*Update schemas that are not columns of the table, such as Decimal money stored in
+    # cents. SQLModel drops unknown names without a word, so __init__, model_validate() and sqlmodel_update()
+    # hand these to _set_schema_values() instead.
+    __schema_fields__: ClassVar[Tuple[str, ...]] = ()
+
+    def __init__(self, **data: Any) -> None:
+        values = {name: data.pop(name) for name in self.__schema_fields__ if name in data}
+        super().__init__(**data)
+        self._set_schema_values(values)
+
+    @classmethod
+    def model_validate(  # type: ignore[override]
+        cls,
+        obj: Any,
+        *,
+        strict: Optional[bool] = None,
+        from_attributes: Optional[bool] = None,
+        context: Optional[Dict[str, Any]] = None,
+        update: Optional[Dict[str, Any]] = None,
+    ) -> Self:
+        instance = super().model_validate(
+            obj, strict=strict, from_attributes=from_attributes, context=context, update=update
+        )
+        instance._set_schema_values(cls._schema_values(obj, update))
+        return instance
+
+    def sqlmodel_update(self, obj: Dict[str, Any] | BaseModel, *, update: Optional[Dict[str, Any]] = None) -> Self:
+        data = obj if isinstance(obj, dict) else obj.model_dump(exclude_unset=True)
+        super().sqlmodel_update(data, update=update)
+        self._set_schema_values(self._schema_values(data, update))
+        return self
+
+    @classmethod
+    def _schema_values(cls, obj: Any, update: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+        if isinstance(obj, Mapping):
+            values = {name: obj[name] for name in cls.__schema_fields__ if name in obj}
+        else:
+            values = {name: getattr(obj, name) for name in cls.__schema_fields__ if hasattr(obj, name)}
+        values.update((name, value) for name, value in (update or {}).items() if name in cls.__schema_fields__)
+        return values
+
+    def _set_schema_values(self, values: Mapping[str, Any]) -> None:
+        """Store schema-only field values; by default through a property setter of the same name."""
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Build an instance from a trusted database row, skipping Pydantic validation.
+
+        Untrusted input must still go through the *Create/*Update schemas below.
+        """
+        loader = _ROW_LOADERS.get(cls)
+        if loader is None:
+            loader = _ROW_LOADERS[cls] = _compile_row_loader(cls)
+        return loader(row)
+
+    @classmethod
+    def bulk_create(cls, session: Session, rows: Sequence[Dict[str, Any]]) -> None:
+        """INSERT many rows as one executemany, without building ORM objects or running validation.
+
+        Columns missing from a row get their Python-side or server defaults.
+        """
+        if not rows:
+            return
+        session.execute(insert(cls), rows)
+
+
+class User(TableModel, table=True):
     __tablename__ = "users"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    email: str = Field(unique=True, max_length=255, regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
-    password_hash: str = Field(max_length=255)
+    email: str = Field(unique=True, max_length=255)
     full_name: str = Field(max_length=100)
     nim_nik: Optional[str] = Field(default=None, max_length=50)  # NIM for students, NIK for staff
     role: UserRole = Field(default=UserRole.STUDENT)
     status: UserStatus = Field(default=UserStatus.PENDING)
     phone: Optional[str] = Field(default=None, max_length=20)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW, "onupdate": _DB_UTCNOW}
+    )
     last_login: Optional[datetime] = Field(default=None)
     verified_at: Optional[datetime] = Field(default=None)
     verified_by_id: Optional[int] = Field(default=None, foreign_key="users.id")
 
     # Relationships
+    # Relationships default to lazy="raise_on_sql" throughout: load what a page needs with selectinload() at the
+    # query site instead of one SELECT per row. Only a few many-to-one references that list rows always show are
+    # eager ("selectin"); collections never are, since they would chain off those and load every child row.
+    # Rarely-needed reverse collections (verified users, notifications, audit logs) are deliberately
+    # not mapped; query them by foreign key, e.g. select(AuditLog).where(AuditLog.user_id == user.id).
     verified_by: Optional["User"] = Relationship(
-        back_populates="verified_users", sa_relationship_kwargs={"remote_side": "User.id", "post_update": True}
+        sa_relationship_kwargs={"lazy": "raise_on_sql", "remote_side": "User.id", "post_update": True}
+    )
+    borrowings: List["Borrowing"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "foreign_keys": "[Borrowing.user_id]"}
+    )
+    lab_memberships: List["LabMember"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql"}
     )
-    verified_users: List["User"] = Relationship(back_populates="verified_by")
-    borrowings: List["Borrowing"] = Relationship(back_populates="user")
-    notifications: List["Notification"] = Relationship(back_populates="user")
-    audit_logs: List["AuditLog"] = Relationship(back_populates="user")
-    lab_memberships: List["LabMember"] = Relationship(back_populates="user")
+    # Credentials live in their own 1:1 table so user rows read by listings and joins stay narrow
+    auth: Optional["UserAuth"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"lazy": "raise_on_sql", "uselist": False, "cascade": "all, delete-orphan"},
+    )
+
+    @field_validator("email")
+    @classmethod
+    def _validate_email(cls, value: str) -> str:
+        return _check_email(value)
 
 
-class Lab(SQLModel, table=True):
+class UserAuth(TableModel, table=True):
+    __tablename__ = "user_auth"  # type: ignore[assignment]
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    password_hash: str = Field(max_length=255)
+
+    # Relationships
+    user: User = Relationship(back_populates="auth", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+
+
+class Lab(TableModel, table=True):
     __tablename__ = "labs"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100)
     code: str = Field(unique=True, max_length=20)
-    description: str = Field(default="")
+    description: str = Field(default="", sa_type=Text)
     location: str = Field(max_length=200)
     capacity: int = Field(default=0)
     operating_hours: str = Field(default="")
@@ -125,96 +443,298 @@ class Lab(SQLModel, table=True):
     contact_phone: Optional[str] = Field(default=None, max_length=20)
     rules_document: Optional[str] = Field(default=None)  # PDF file path
     sop_document: Optional[str] = Field(default=None)  # PDF file path
-    gallery: List[str] = Field(default=[], sa_column=Column(JSON))  # Image file paths
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW, "onupdate": _DB_UTCNOW}
+    )
+
+    # Relationships
+    equipment: List["Equipment"] = Relationship(back_populates="lab", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    members: List["LabMember"] = Relationship(back_populates="lab", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    gallery: List["LabGalleryImage"] = Relationship(
+        back_populates="lab",
+        sa_relationship_kwargs={
+            "lazy": "raise_on_sql",
+            "order_by": "LabGalleryImage.position",
+            "cascade": "all, delete-orphan",
+        },
+    )
+
+
+class LabGalleryImage(TableModel, table=True):
+    __tablename__ = "lab_gallery_images"  # type: ignore[assignment]
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    lab_id: int = Field(foreign_key="labs.id", index=True)
+    path: str = Field()  # Image file path
+    position: int = Field(default=0)
 
     # Relationships
-    equipment: List["Equipment"] = Relationship(back_populates="lab")
-    members: List["LabMember"] = Relationship(back_populates="lab")
+    lab: Lab = Relationship(back_populates="gallery", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
-class LabMember(SQLModel, table=True):
+class LabMember(TableModel, table=True):
     __tablename__ = "lab_members"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
     lab_id: int = Field(foreign_key="labs.id")
     user_id: int = Field(foreign_key="users.id")
-    role: str = Field(max_length=50)  # "head", "laboran", "member"
-    joined_at: datetime = Field(default_factory=datetime.utcnow)
+    role: LabMemberRole = Field()
+    joined_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
 
     # Relationships
-    lab: Lab = Relationship(back_populates="members")
-    user: User = Relationship(back_populates="lab_memberships")
+    lab: Lab = Relationship(back_populates="members", sa_relationship_kwargs={"lazy": "selectin"})
+    user: User = Relationship(back_populates="lab_memberships", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
-class EquipmentCategory(SQLModel, table=True):
+class EquipmentCategory(TableModel, table=True):
     __tablename__ = "equipment_categories"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100)
-    description: str = Field(default="")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    description: str = Field(default="", sa_type=Text)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
 
     # Relationships
-    equipment: List["Equipment"] = Relationship(back_populates="category")
+    equipment: List["Equipment"] = Relationship(
+        back_populates="category", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
 
 
-class Equipment(SQLModel, table=True):
+# Scalar values only: each spec is stored in one typed column (see EquipmentSpec)
+SpecValue = str | bool | int | float | Decimal | None
+
+
+class Equipment(TableModel, table=True):
     __tablename__ = "equipment"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_equipment_lab_status_category", "lab_id", "status", "category_id"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=200)
     code: str = Field(unique=True, max_length=50)
     category_id: int = Field(foreign_key="equipment_categories.id")
     lab_id: int = Field(foreign_key="labs.id")
-    description: str = Field(default="")
-    specifications: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
     brand: Optional[str] = Field(default=None, max_length=100)
     model: Optional[str] = Field(default=None, max_length=100)
     serial_number: Optional[str] = Field(default=None, max_length=100)
     purchase_date: Optional[datetime] = Field(default=None)
-    purchase_price: Optional[Decimal] = Field(default=Decimal("0"), max_digits=15, decimal_places=2)
-    condition: str = Field(default="good")  # good, fair, poor
+    purchase_price_cents: Optional[int] = Field(default=0, sa_type=BigInteger)  # in cents; see purchase_price
+    condition: EquipmentCondition = Field(default=EquipmentCondition.GOOD)
     status: EquipmentStatus = Field(default=EquipmentStatus.AVAILABLE)
     needs_head_approval: bool = Field(default=False)
     image_path: Optional[str] = Field(default=None)
-    manual_document: Optional[str] = Field(default=None)  # PDF file path
-    qr_code_path: Optional[str] = Field(default=None)
     maintenance_interval_days: int = Field(default=365)  # Days between maintenance
     last_maintenance: Optional[datetime] = Field(default=None)
     next_maintenance: Optional[datetime] = Field(default=None)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW, "onupdate": _DB_UTCNOW}
+    )
+
+    __schema_fields__ = ("purchase_price", "description", "specifications")
+
+    # Relationships
+    category: EquipmentCategory = Relationship(
+        back_populates="equipment", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    lab: Lab = Relationship(back_populates="equipment", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    borrowings: List["Borrowing"] = Relationship(
+        back_populates="equipment", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    spec_rows: List["EquipmentSpec"] = Relationship(
+        back_populates="equipment",
+        sa_relationship_kwargs={
+            "lazy": "raise_on_sql",
+            "order_by": "EquipmentSpec.key",
+            "cascade": "all, delete-orphan",
+        },
+    )
+    # Detail-page-only columns, kept out of the rows that equipment listings scan
+    detail: Optional["EquipmentDetail"] = Relationship(
+        back_populates="equipment",
+        sa_relationship_kwargs={"lazy": "raise_on_sql", "uselist": False, "cascade": "all, delete-orphan"},
+    )
+    maintenance_records: List["MaintenanceRecord"] = Relationship(
+        back_populates="equipment", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+
+    @property
+    def purchase_price(self) -> Optional[Decimal]:
+        return from_cents(self.purchase_price_cents)
+
+    @purchase_price.setter
+    def purchase_price(self, value: Optional[Decimal]) -> None:
+        self.purchase_price_cents = to_cents(value)
+
+    def _set_schema_values(self, values: Mapping[str, Any]) -> None:
+        """Also puts the schemas' description on the detail row; on a loaded row, load Equipment.detail first.
+
+        There is deliberately no description property: reads go through equipment.detail, so it is visible
+        that they need the detail row loaded.
+        """
+        values = dict(values)
+        if "description" in values:
+            description = values.pop("description")
+            if self.detail is not None:
+                self.detail.description = description
+            elif description:
+                self.detail = EquipmentDetail(description=description)  # type: ignore[call-arg]
+        super()._set_schema_values(values)
+
+    def set_specifications(self, specs: Mapping[str, SpecValue]) -> None:
+        """Make the spec rows match specs, updating rows for keys that already exist."""
+        # Reusing rows keeps the (equipment_id, key) constraint happy: the unit of work inserts before it deletes
+        current = {spec.key: spec for spec in self.spec_rows}
+        rows = []
+        for key, value in specs.items():
+            spec = current.get(key) or EquipmentSpec(key=key)  # type: ignore[call-arg]
+            spec.value = value
+            rows.append(spec)
+        self.spec_rows = rows
+
+    # Dict view of spec_rows in the shape of the former JSON column, which the *Create/*Update schemas still use
+    @property
+    def specifications(self) -> Dict[str, Any]:
+        return {spec.key: spec.value for spec in self.spec_rows}
+
+    @specifications.setter
+    def specifications(self, specs: Mapping[str, SpecValue]) -> None:
+        self.set_specifications(specs)
+
+    @classmethod
+    def with_specifications(cls, specs: Mapping[str, SpecValue]) -> Select[Any]:
+        """Equipment that has every one of the given key/value specs."""
+        return sa_select(cls).where(
+            *(col(cls.spec_rows).any(EquipmentSpec.matches(key, value)) for key, value in specs.items())
+        )
+
+
+class EquipmentDetail(TableModel, table=True):
+    __tablename__ = "equipment_details"  # type: ignore[assignment]
+
+    equipment_id: int = Field(foreign_key="equipment.id", primary_key=True)
+    description: str = Field(default="", sa_type=Text)
+    manual_document: Optional[str] = Field(default=None)  # PDF file path
+    qr_code_path: Optional[str] = Field(default=None)
 
     # Relationships
-    category: EquipmentCategory = Relationship(back_populates="equipment")
-    lab: Lab = Relationship(back_populates="equipment")
-    borrowings: List["Borrowing"] = Relationship(back_populates="equipment")
-    maintenance_records: List["MaintenanceRecord"] = Relationship(back_populates="equipment")
-    availability_slots: List["EquipmentAvailability"] = Relationship(back_populates="equipment")
+    equipment: Equipment = Relationship(back_populates="detail", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+
+
+class EquipmentSpec(TableModel, table=True):
+    __tablename__ = "equipment_specs"  # type: ignore[assignment]
+    __table_args__ = (
+        UniqueConstraint("equipment_id", "key", name="uq_equipment_specs_equipment_key"),
+        Index("ix_equipment_specs_key_text", "key", "value_text"),
+        Index("ix_equipment_specs_key_num", "key", "value_num"),
+    )
 
+    id: Optional[int] = Field(default=None, primary_key=True)
+    equipment_id: int = Field(foreign_key="equipment.id")
+    key: str = Field(max_length=100)
+    # Exactly one of the value columns is set, picked by the Python type of the value
+    value_text: Optional[str] = Field(default=None, sa_type=Text)
+    value_num: Optional[Decimal] = Field(default=None)
+    value_bool: Optional[bool] = Field(default=None)
 
-class EquipmentAvailability(SQLModel, table=True):
+    # Relationships
+    equipment: Equipment = Relationship(back_populates="spec_rows", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+
+    @staticmethod
+    def _split(value: SpecValue) -> Dict[str, Any]:
+        if value is None:
+            return {"value_text": None, "value_num": None, "value_bool": None}
+        if isinstance(value, bool):
+            return {"value_text": None, "value_num": None, "value_bool": value}
+        if isinstance(value, (int, float, Decimal)):
+            return {"value_text": None, "value_num": Decimal(str(value)), "value_bool": None}
+        if isinstance(value, str):
+            return {"value_text": value, "value_num": None, "value_bool": None}
+        # Nested values have no column to go in; storing their repr would hand back a string
+        raise TypeError(f"Specification values must be text, numbers, booleans or None, not {type(value).__name__}")
+
+    @property
+    def value(self) -> Any:
+        if self.value_bool is not None:
+            return self.value_bool
+        if self.value_num is not None:
+            return self.value_num
+        return self.value_text
+
+    @value.setter
+    def value(self, value: SpecValue) -> None:
+        for name, part in self._split(value).items():
+            setattr(self, name, part)
+
+    @classmethod
+    def matches(cls, key: str, value: SpecValue) -> ColumnElement[bool]:
+        """Predicate for a spec row with this key and value; rides the (key, value_*) indexes."""
+        parts = cls._split(value)
+        if value is None:
+            # The key is present with no value, not "any value"
+            conditions = [getattr(cls, name).is_(None) for name in parts]
+        else:
+            conditions = [getattr(cls, name) == part for name, part in parts.items() if part is not None]
+        return and_(col(cls.key) == key, *conditions)
+
+
+class EquipmentAvailability(TableModel, table=True):
     __tablename__ = "equipment_availability"  # type: ignore[assignment]
+    __table_args__ = (
+        CheckConstraint("start_min >= 0 AND end_min <= 1440", name="ck_equipment_availability_day"),
+        CheckConstraint("end_min > start_min", name="ck_equipment_availability_range"),
+        Index("ix_equipment_availability_slot", "equipment_id", "date", "start_min"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     equipment_id: int = Field(foreign_key="equipment.id")
     date: datetime = Field()
-    start_time: str = Field(max_length=5)  # HH:MM format
-    end_time: str = Field(max_length=5)  # HH:MM format
+    start_min: int = Field(ge=0, le=1439, sa_type=SmallInteger)  # minutes since midnight
+    end_min: int = Field(ge=1, le=1440, sa_type=SmallInteger)  # minutes since midnight, exclusive
     is_blocked: bool = Field(default=False)  # True if blocked for maintenance/other reasons
-    block_reason: Optional[str] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    block_reason: Optional[str] = Field(default=None, sa_type=Text)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
 
     # Relationships
-    equipment: Equipment = Relationship(back_populates="availability_slots")
+    equipment: Equipment = Relationship(sa_relationship_kwargs={"lazy": "raise_on_sql"})
+
+    @classmethod
+    def overlapping(cls, equipment_id: int, date: datetime, start_min: int, end_min: int) -> Select[Any]:
+        """Slots of one equipment on one day that intersect [start_min, end_min)."""
+        return sa_select(cls).where(
+            col(cls.equipment_id) == equipment_id,
+            col(cls.date) == date,
+            col(cls.start_min) < end_min,
+            col(cls.end_min) > start_min,
+        )
 
 
-class Borrowing(SQLModel, table=True):
+class Borrowing(TableModel, table=True):
     __tablename__ = "borrowings"  # type: ignore[assignment]
+    __table_args__ = (
+        # INCLUDE columns let the "my borrowings" list and the overdue sweep run as index-only scans
+        Index(
+            "ix_borrowings_user_status_start",
+            "user_id",
+            "status",
+            "start_datetime",
+            postgresql_include=["end_datetime", "equipment_id"],
+        ),
+        Index("ix_borrowings_equipment_range", "equipment_id", "start_datetime", "end_datetime"),
+        Index("ix_borrowings_status_end", "status", "end_datetime", postgresql_include=["user_id", "equipment_id"]),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
@@ -223,9 +743,9 @@ class Borrowing(SQLModel, table=True):
     start_datetime: datetime = Field()
     end_datetime: datetime = Field()
     actual_return_datetime: Optional[datetime] = Field(default=None)
-    purpose: str = Field(max_length=500)
+    purpose: str = Field(sa_type=Text)  # length is limited by BorrowingCreate, not the column
     jsa_document: Optional[str] = Field(default=None)  # JSA PDF file path
-    notes: str = Field(default="")
+    notes: str = Field(default="", sa_type=Text)
 
     # Approval tracking
     approved_by_laboran_id: Optional[int] = Field(default=None, foreign_key="users.id")
@@ -234,9 +754,9 @@ class Borrowing(SQLModel, table=True):
     approved_by_head_at: Optional[datetime] = Field(default=None)
 
     # Condition tracking
-    condition_before: str = Field(default="good")
-    condition_after: Optional[str] = Field(default=None)
-    damage_report: Optional[str] = Field(default=None)
+    condition_before: EquipmentCondition = Field(default=EquipmentCondition.GOOD)
+    condition_after: Optional[EquipmentCondition] = Field(default=None)
+    damage_report: Optional[str] = Field(default=None, sa_type=Text)
 
     # Check-in/out tracking
     checked_out_at: Optional[datetime] = Field(default=None)
@@ -244,15 +764,21 @@ class Borrowing(SQLModel, table=True):
     checked_in_at: Optional[datetime] = Field(default=None)
     checked_in_by_id: Optional[int] = Field(default=None, foreign_key="users.id")
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW, "onupdate": _DB_UTCNOW}
+    )
 
     # Relationships
-    user: User = Relationship(back_populates="borrowings")
-    equipment: Equipment = Relationship(back_populates="borrowings")
+    user: User = Relationship(
+        back_populates="borrowings", sa_relationship_kwargs={"foreign_keys": "[Borrowing.user_id]", "lazy": "selectin"}
+    )
+    equipment: Equipment = Relationship(back_populates="borrowings", sa_relationship_kwargs={"lazy": "selectin"})
 
 
-class MaintenanceRecord(SQLModel, table=True):
+class MaintenanceRecord(TableModel, table=True):
     __tablename__ = "maintenance_records"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -262,96 +788,307 @@ class MaintenanceRecord(SQLModel, table=True):
     scheduled_date: datetime = Field()
     completed_date: Optional[datetime] = Field(default=None)
     performed_by: Optional[str] = Field(default=None, max_length=100)
-    description: str = Field()
-    cost: Optional[Decimal] = Field(default=Decimal("0"), max_digits=10, decimal_places=2)
-    notes: str = Field(default="")
-    attachments: List[str] = Field(default=[], sa_column=Column(JSON))  # File paths
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    description: str = Field(sa_type=Text)
+    cost_cents: Optional[int] = Field(default=0, sa_type=BigInteger)  # in cents; see cost
+    notes: str = Field(default="", sa_type=Text)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW, "onupdate": _DB_UTCNOW}
+    )
+
+    __schema_fields__ = ("cost",)
 
     # Relationships
-    equipment: Equipment = Relationship(back_populates="maintenance_records")
+    equipment: Equipment = Relationship(
+        back_populates="maintenance_records", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    attachments: List["MaintenanceAttachment"] = Relationship(
+        back_populates="maintenance_record",
+        sa_relationship_kwargs={
+            "lazy": "raise_on_sql",
+            "order_by": "MaintenanceAttachment.position",
+            "cascade": "all, delete-orphan",
+        },
+    )
 
+    @property
+    def cost(self) -> Optional[Decimal]:
+        return from_cents(self.cost_cents)
 
-class Notification(SQLModel, table=True):
-    __tablename__ = "notifications"  # type: ignore[assignment]
+    @cost.setter
+    def cost(self, value: Optional[Decimal]) -> None:
+        self.cost_cents = to_cents(value)
+
+
+class MaintenanceAttachment(TableModel, table=True):
+    __tablename__ = "maintenance_attachments"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
+    maintenance_record_id: int = Field(foreign_key="maintenance_records.id", index=True)
+    path: str = Field()  # File path
+    position: int = Field(default=0)
+
+    # Relationships
+    maintenance_record: MaintenanceRecord = Relationship(
+        back_populates="attachments", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+
+
+# Default look-back of recent() on the monthly partitioned tables; the created_at bound lets PostgreSQL skip
+# the partitions of older months
+RECENT_WINDOW = timedelta(days=30)
+
+
+class Notification(TableModel, table=True):
+    __tablename__ = "notifications"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_notifications_user_status", "user_id", "status"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Partitioned by month, so the partition key is part of the primary key
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
     user_id: int = Field(foreign_key="users.id")
     type: NotificationType = Field()
     title: str = Field(max_length=200)
-    message: str = Field()
+    message: str = Field(sa_type=Text)
     status: NotificationStatus = Field(default=NotificationStatus.UNREAD)
     related_id: Optional[int] = Field(default=None)  # ID of related entity (borrowing, user, etc.)
     related_type: Optional[str] = Field(default=None, max_length=50)  # Type of related entity
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, primary_key=True, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
     read_at: Optional[datetime] = Field(default=None)
 
     # Relationships
-    user: User = Relationship(back_populates="notifications")
-
-
-class AuditLog(SQLModel, table=True):
+    user: User = Relationship(sa_relationship_kwargs={"lazy": "raise_on_sql"})
+
+    @classmethod
+    def recent(cls, since: Optional[datetime] = None) -> Select[Any]:
+        """Notifications created since the given time, by default within RECENT_WINDOW."""
+        return sa_select(cls).where(col(cls.created_at) >= (since or utcnow() - RECENT_WINDOW))
+
+
+def _diff(old: Mapping[str, Any], new: Mapping[str, Any]) -> Iterator[Tuple[str, Any, Any]]:
+    for name in {**old, **new}:
+        before, after = old.get(name), new.get(name)
+        if before != after:
+            yield name, before, after
+
+
+def _field_change_rows(keys: Iterable[Sequence[Any]], rows: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """AuditLogFieldChange rows for AuditLog.bulk_log(), given each log's (id, created_at) in row order."""
+    return [
+        {
+            "audit_log_id": audit_log_id,
+            "created_at": created_at,
+            "entity_type": row["entity_type"],
+            "field_name": name,
+            "old_value": before,
+            "new_value": after,
+        }
+        for (audit_log_id, created_at), row in zip(keys, rows)
+        for name, before, after in _diff(row.get("old", {}), row.get("new", {}))
+    ]
+
+
+class AuditLog(TableModel, table=True):
     __tablename__ = "audit_logs"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_audit_logs_entity", "entity_type", "entity_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    # Partitioned by month, so the partition key is part of the primary key
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
     user_id: Optional[int] = Field(default=None, foreign_key="users.id")
     action: AuditAction = Field()
     entity_type: str = Field(max_length=50)  # Table/model name
     entity_id: Optional[int] = Field(default=None)
-    old_values: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
-    new_values: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
     ip_address: Optional[str] = Field(default=None, max_length=45)
-    user_agent: Optional[str] = Field(default=None)
-    description: str = Field(default="")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    user_agent: Optional[str] = Field(default=None, sa_type=Text)
+    description: str = Field(default="", sa_type=Text)
+    created_at: Optional[datetime] = Field(
+        default=None, primary_key=True, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
+
+    # Relationships
+    user: Optional[User] = Relationship(sa_relationship_kwargs={"lazy": "raise_on_sql"})
+    changes: List["AuditLogFieldChange"] = Relationship(
+        back_populates="audit_log", sa_relationship_kwargs={"lazy": "raise_on_sql", "cascade": "all, delete-orphan"}
+    )
+
+    def record_changes(self, old: Mapping[str, Any], new: Mapping[str, Any]) -> None:
+        """Store one AuditLogFieldChange per field that differs between the two snapshots."""
+        for name, before, after in _diff(old, new):
+            # audit_log_id is filled in from the relationship on flush
+            change = AuditLogFieldChange(  # type: ignore[call-arg]
+                entity_type=self.entity_type, field_name=name, old_value=before, new_value=after
+            )
+            self.changes.append(change)
+
+    @classmethod
+    def bulk_log(cls, session: Session, rows: Sequence[Dict[str, Any]]) -> None:
+        """Insert audit rows and their field changes with one multi-row INSERT per table.
+
+        Each row holds AuditLog columns plus optional "old"/"new" snapshots that are diffed like record_changes().
+        """
+        if not rows:
+            return
+        entries = [{key: value for key, value in row.items() if key not in ("old", "new")} for row in rows]
+        keys = session.execute(cls._insert_returning_keys(), entries)
+        AuditLogFieldChange.bulk_create(session, _field_change_rows(keys, rows))
+
+    @classmethod
+    def _insert_returning_keys(cls) -> ReturningInsert[Any]:
+        # sort_by_parameter_order keeps the returned (id, created_at) keys aligned with the rows passed in
+        return insert(cls).returning(col(cls.id), col(cls.created_at), sort_by_parameter_order=True)
+
+    @classmethod
+    def recent(cls, since: Optional[datetime] = None) -> Select[Any]:
+        """Audit logs created since the given time, by default within RECENT_WINDOW."""
+        return sa_select(cls).where(col(cls.created_at) >= (since or utcnow() - RECENT_WINDOW))
+
+    # Read-side views of the changed fields, in the shape of the former JSON snapshot columns; a loaded log needs
+    # selectinload(AuditLog.changes)
+    @property
+    def old_values(self) -> Dict[str, Any]:
+        return {change.field_name: change.old_value for change in self.changes}
+
+    @property
+    def new_values(self) -> Dict[str, Any]:
+        return {change.field_name: change.new_value for change in self.changes}
+
+
+class AuditLogFieldChange(TableModel, table=True):
+    __tablename__ = "audit_log_field_changes"  # type: ignore[assignment]
+    __table_args__ = (
+        ForeignKeyConstraint(["audit_log_id", "created_at"], ["audit_logs.id", "audit_logs.created_at"]),
+        Index("ix_audit_log_field_changes_entity_field", "entity_type", "field_name"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Partitioned like audit_logs; created_at is the parent log's, copied through the composite foreign key
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    created_at: Optional[datetime] = Field(default=None, primary_key=True)
+    audit_log_id: int = Field(index=True)
+    entity_type: str = Field(max_length=50)  # Copied from the audit log so field history is queryable without a join
+    field_name: str = Field(max_length=100)
+    old_value: Optional[Any] = Field(default=None, sa_column=Column(JSONB))
+    new_value: Optional[Any] = Field(default=None, sa_column=Column(JSONB))
 
     # Relationships
-    user: Optional[User] = Relationship(back_populates="audit_logs")
+    audit_log: AuditLog = Relationship(back_populates="changes", sa_relationship_kwargs={"lazy": "raise_on_sql"})
 
 
-class AppContent(SQLModel, table=True):
+# Page views read it through app.content_cache.cached_content()
+class AppContent(TableModel, table=True):
     __tablename__ = "app_content"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
     key: str = Field(unique=True, max_length=100)  # landing_page_content, about_us, etc.
-    content: str = Field()  # Markdown content
+    content: str = Field(sa_type=Text)  # Markdown content
     content_type: str = Field(default="markdown", max_length=20)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW, "onupdate": _DB_UTCNOW}
+    )
     updated_by_id: Optional[int] = Field(default=None, foreign_key="users.id")
 
 
-class HelpTicket(SQLModel, table=True):
+class HelpTicket(TableModel, table=True):
     __tablename__ = "help_tickets"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
     subject: str = Field(max_length=200)
-    message: str = Field()
-    status: str = Field(default="open", max_length=20)  # open, in_progress, resolved, closed
-    priority: str = Field(default="normal", max_length=20)  # low, normal, high, urgent
-    category: str = Field(default="general", max_length=50)  # general, password_reset, account, technical
+    message: str = Field(sa_type=Text)
+    status: HelpTicketStatus = Field(default=HelpTicketStatus.OPEN)
+    priority: HelpTicketPriority = Field(default=HelpTicketPriority.NORMAL)
+    category: HelpTicketCategory = Field(default=HelpTicketCategory.GENERAL)
     assigned_to_id: Optional[int] = Field(default=None, foreign_key="users.id")
     resolved_at: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"nullable": False, "server_default": _DB_UTCNOW, "onupdate": _DB_UTCNOW}
+    )
+
+
+ALL_MODELS: Tuple[type[TableModel], ...] = (
+    User,
+    UserAuth,
+    Lab,
+    LabGalleryImage,
+    LabMember,
+    EquipmentCategory,
+    Equipment,
+    EquipmentDetail,
+    EquipmentSpec,
+    EquipmentAvailability,
+    Borrowing,
+    MaintenanceRecord,
+    MaintenanceAttachment,
+    Notification,
+    AuditLog,
+    AuditLogFieldChange,
+    AppContent,
+    HelpTicket,
+)
+
+# Resolve string relationship targets and build all mappers now, at import, instead of on the first query
+configure_mappers()
+
+# Append-mostly tables, range-partitioned by month on created_at: recent-window queries that bound created_at
+# only scan recent partitions, and old months are dropped whole. Each table gets a DEFAULT partition so inserts
+# never fail; app.database keeps partitions for this month and the next in place, moving any rows that reached
+# the DEFAULT partition first, and drops notification partitions past their retention.
+MONTHLY_PARTITIONED: Tuple[type[TableModel], ...] = (AuditLog, AuditLogFieldChange, Notification)
+
+for _model in MONTHLY_PARTITIONED:
+    event.listen(
+        _model.__table__,  # type: ignore[attr-defined]
+        "after_create",
+        DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"),
+    )
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
 
 
-class UserCreate(SQLModel, table=False):
-    email: str = Field(max_length=255, regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+class InputSchema(SQLModel):
+    """Common base for the *Create/*Update request schemas."""
+
+    # Unknown keys are errors rather than silently dropped, so a misspelled field can't turn into a no-op update
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
+    def __init__(self, **data: Any) -> None:
+        # Straight to the validator: SQLModel's __init__ snapshots and merges __dict__ around it, which only
+        # table models need, and these are built on every write request
+        self.__pydantic_validator__.validate_python(data, self_instance=self)
+
+
+class UserCreate(InputSchema):
+    email: str = Field(max_length=255)
     password: str = Field(min_length=8, max_length=100)
     full_name: str = Field(max_length=100)
     nim_nik: Optional[str] = Field(default=None, max_length=50)
     role: UserRole = Field(default=UserRole.STUDENT)
     phone: Optional[str] = Field(default=None, max_length=20)
 
+    @field_validator("email")
+    @classmethod
+    def _validate_email(cls, value: str) -> str:
+        return _check_email(value)
 
-class UserUpdate(SQLModel, table=False):
+
+class UserUpdate(InputSchema):
     email: Optional[str] = Field(default=None, max_length=255)
     full_name: Optional[str] = Field(default=None, max_length=100)
     nim_nik: Optional[str] = Field(default=None, max_length=50)
@@ -359,19 +1096,24 @@ class UserUpdate(SQLModel, table=False):
     role: Optional[UserRole] = Field(default=None)
     status: Optional[UserStatus] = Field(default=None)
 
+    @field_validator("email")
+    @classmethod
+    def _validate_email(cls, value: Optional[str]) -> Optional[str]:
+        return value if value is None else _check_email(value)
+
 
-class UserLogin(SQLModel, table=False):
+class UserLogin(InputSchema):
     email: str = Field(max_length=255)
     password: str = Field(min_length=1, max_length=100)
 
 
-class PasswordReset(SQLModel, table=False):
+class PasswordReset(InputSchema):
     email: str = Field(max_length=255)
     new_password: str = Field(min_length=8, max_length=100)
     confirm_password: str = Field(min_length=8, max_length=100)
 
 
-class LabCreate(SQLModel, table=False):
+class LabCreate(InputSchema):
     name: str = Field(max_length=100)
     code: str = Field(max_length=20)
     description: str = Field(default="")
@@ -382,7 +1124,7 @@ class LabCreate(SQLModel, table=False):
     contact_phone: Optional[str] = Field(default=None, max_length=20)
 
 
-class LabUpdate(SQLModel, table=False):
+class LabUpdate(InputSchema):
     name: Optional[str] = Field(default=None, max_length=100)
     code: Optional[str] = Field(default=None, max_length=20)
     description: Optional[str] = Field(default=None)
@@ -394,40 +1136,40 @@ class LabUpdate(SQLModel, table=False):
     is_active: Optional[bool] = Field(default=None)
 
 
-class EquipmentCreate(SQLModel, table=False):
+class EquipmentCreate(InputSchema):
     name: str = Field(max_length=200)
     code: str = Field(max_length=50)
     category_id: int
     lab_id: int
     description: str = Field(default="")
-    specifications: Dict[str, Any] = Field(default={})
+    specifications: Dict[str, SpecValue] = Field(default_factory=dict)
     brand: Optional[str] = Field(default=None, max_length=100)
     model: Optional[str] = Field(default=None, max_length=100)
     serial_number: Optional[str] = Field(default=None, max_length=100)
     purchase_date: Optional[datetime] = Field(default=None)
-    purchase_price: Optional[Decimal] = Field(default=Decimal("0"))
-    condition: str = Field(default="good")
+    purchase_price: Optional[Decimal] = Field(default=Decimal("0"), decimal_places=2)
+    condition: EquipmentCondition = Field(default=EquipmentCondition.GOOD)
     needs_head_approval: bool = Field(default=False)
     maintenance_interval_days: int = Field(default=365)
 
 
-class EquipmentUpdate(SQLModel, table=False):
+class EquipmentUpdate(InputSchema):
     name: Optional[str] = Field(default=None, max_length=200)
     category_id: Optional[int] = Field(default=None)
     lab_id: Optional[int] = Field(default=None)
     description: Optional[str] = Field(default=None)
-    specifications: Optional[Dict[str, Any]] = Field(default=None)
+    specifications: Optional[Dict[str, SpecValue]] = Field(default=None)
     brand: Optional[str] = Field(default=None, max_length=100)
     model: Optional[str] = Field(default=None, max_length=100)
     serial_number: Optional[str] = Field(default=None, max_length=100)
-    condition: Optional[str] = Field(default=None)
+    condition: Optional[EquipmentCondition] = Field(default=None)
     status: Optional[EquipmentStatus] = Field(default=None)
     needs_head_approval: Optional[bool] = Field(default=None)
     maintenance_interval_days: Optional[int] = Field(default=None)
     is_active: Optional[bool] = Field(default=None)
 
 
-class BorrowingCreate(SQLModel, table=False):
+class BorrowingCreate(InputSchema):
     equipment_id: int
     start_datetime: datetime
     end_datetime: datetime
@@ -435,14 +1177,14 @@ class BorrowingCreate(SQLModel, table=False):
     notes: str = Field(default="")
 
 
-class BorrowingUpdate(SQLModel, table=False):
+class BorrowingUpdate(InputSchema):
     status: Optional[BorrowingStatus] = Field(default=None)
     notes: Optional[str] = Field(default=None)
-    condition_after: Optional[str] = Field(default=None)
+    condition_after: Optional[EquipmentCondition] = Field(default=None)
     damage_report: Optional[str] = Field(default=None)
 
 
-class NotificationCreate(SQLModel, table=False):
+class NotificationCreate(InputSchema):
     user_id: int
     type: NotificationType
     title: str = Field(max_length=200)
@@ -451,46 +1193,153 @@ class NotificationCreate(SQLModel, table=False):
     related_type: Optional[str] = Field(default=None, max_length=50)
 
 
-class MaintenanceRecordCreate(SQLModel, table=False):
+class MaintenanceRecordCreate(InputSchema):
     equipment_id: int
     maintenance_type: MaintenanceType
     scheduled_date: datetime
     description: str
     performed_by: Optional[str] = Field(default=None, max_length=100)
-    cost: Optional[Decimal] = Field(default=Decimal("0"))
+    cost: Optional[Decimal] = Field(default=Decimal("0"), decimal_places=2)
     notes: str = Field(default="")
 
 
-class MaintenanceRecordUpdate(SQLModel, table=False):
+class MaintenanceRecordUpdate(InputSchema):
     status: Optional[MaintenanceStatus] = Field(default=None)
     completed_date: Optional[datetime] = Field(default=None)
     performed_by: Optional[str] = Field(default=None, max_length=100)
-    cost: Optional[Decimal] = Field(default=None)
+    cost: Optional[Decimal] = Field(default=None, decimal_places=2)
     notes: Optional[str] = Field(default=None)
 
 
-class HelpTicketCreate(SQLModel, table=False):
+class HelpTicketCreate(InputSchema):
     subject: str = Field(max_length=200)
     message: str
-    priority: str = Field(default="normal", max_length=20)
-    category: str = Field(default="general", max_length=50)
+    priority: HelpTicketPriority = Field(default=HelpTicketPriority.NORMAL)
+    category: HelpTicketCategory = Field(default=HelpTicketCategory.GENERAL)
 
 
-class HelpTicketUpdate(SQLModel, table=False):
-    status: Optional[str] = Field(default=None, max_length=20)
+class HelpTicketUpdate(InputSchema):
+    status: Optional[HelpTicketStatus] = Field(default=None)
     assigned_to_id: Optional[int] = Field(default=None)
 
 
-class AppContentUpdate(SQLModel, table=False):
+class AppContentUpdate(InputSchema):
     content: str
     content_type: str = Field(default="markdown", max_length=20)
     is_active: bool = Field(default=True)
 
 
+# Listing projections: narrow read-only rows for list pages, so they never fetch password hashes,
+# JSON blobs or long text columns. Usage: UserSummary.from_rows(session.execute(UserSummary.statement()))
+
+
+class Projection(SQLModel):
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Fail when the projection is defined, not on the first list page that queries it
+        if cls.__abstractmethods__:
+            raise TypeError(f"{cls.__name__} must implement {', '.join(sorted(cls.__abstractmethods__))}()")
+
+    @classmethod
+    @abstractmethod
+    def statement(cls) -> Select[Any]:
+        """SELECT of exactly this projection's fields."""
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Row[Any]]) -> List[Self]:
+        # Values come straight from our own columns, so skip validation
+        return [cls.model_construct(**row._mapping) for row in rows]
+
+    # Dumps default to JSON-ready values and leave out None fields, which are most optional columns on most rows
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:  # type: ignore[override]
+        kwargs.setdefault("mode", "json")
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:  # type: ignore[override]
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
+
+
+class UserSummary(Projection):
+    id: int
+    full_name: str
+    email: str
+    role: UserRole
+
+    @classmethod
+    def statement(cls) -> Select[Any]:
+        return sa_select(col(User.id), col(User.full_name), col(User.email), col(User.role))
+
+
+class EquipmentSummary(Projection):
+    id: int
+    name: str
+    code: str
+    lab_id: int
+    category_id: int
+    status: EquipmentStatus
+    condition: EquipmentCondition
+    image_path: Optional[str] = None
+    next_maintenance: Optional[datetime] = None
+
+    @classmethod
+    def statement(cls) -> Select[Any]:
+        return sa_select(
+            col(Equipment.id),
+            col(Equipment.name),
+            col(Equipment.code),
+            col(Equipment.lab_id),
+            col(Equipment.category_id),
+            col(Equipment.status),
+            col(Equipment.condition),
+            col(Equipment.image_path),
+            col(Equipment.next_maintenance),
+        )
+
+
+class BorrowingListItem(Projection):
+    id: int
+    status: BorrowingStatus
+    start_datetime: datetime
+    end_datetime: datetime
+    equipment_id: int
+    equipment_name: str
+    user_id: int
+    user_name: str
+
+    @classmethod
+    def statement(cls) -> Select[Any]:
+        return (
+            sa_select(
+                col(Borrowing.id),
+                col(Borrowing.status),
+                col(Borrowing.start_datetime),
+                col(Borrowing.end_datetime),
+                col(Borrowing.equipment_id),
+                col(Equipment.name).label("equipment_name"),
+                col(Borrowing.user_id),
+                col(User.full_name).label("user_name"),
+            )
+            .join(Equipment, col(Borrowing.equipment_id) == col(Equipment.id))
+            .join(User, col(Borrowing.user_id) == col(User.id))
+        )
+
+
 # Statistics and reporting schemas
+# Report rows are built in bulk and never persisted or validated, so they are plain frozen, slotted dataclasses.
+
+
+class StatsRecord:
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)  # type: ignore[call-overload]
 
 
-class EquipmentUsageStats(SQLModel, table=False):
+@dataclass(frozen=True, slots=True)
+class EquipmentUsageStats(StatsRecord):
     equipment_id: int
     equipment_name: str
     total_borrowings: int
@@ -500,7 +1349,8 @@ class EquipmentUsageStats(SQLModel, table=False):
     overdue_count: int
 
 
-class UserBorrowingStats(SQLModel, table=False):
+@dataclass(frozen=True, slots=True)
+class UserBorrowingStats(StatsRecord):
     user_id: int
     user_name: str
     total_borrowings: int
@@ -509,7 +1359,8 @@ class UserBorrowingStats(SQLModel, table=False):
     damage_reports: int
 
 
-class LabUsageStats(SQLModel, table=False):
+@dataclass(frozen=True, slots=True)
+class LabUsageStats(StatsRecord):
     lab_id: int
     lab_name: str
     total_equipment: int
@@ -518,7 +1369,8 @@ class LabUsageStats(SQLModel, table=False):
     average_booking_duration: float
 
 
-class PeriodStats(SQLModel, table=False):
+@dataclass(frozen=True, slots=True)
+class PeriodStats(StatsRecord):
     period: str  # "2024-01", "2024-Q1", etc.
     total_borrowings: int
     completed_borrowings: int
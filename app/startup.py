@@ -1,10 +1,11 @@
-from app.database import create_tables
-from nicegui import ui
+from app.database import create_tables, run_partition_maintenance
+from nicegui import background_tasks, ui
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
+    background_tasks.create(run_partition_maintenance(), name="partition maintenance")
 
     @ui.page("/")
     def index():
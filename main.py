@@ -3,6 +3,7 @@ import os
 from app.startup import startup
 from nicegui import app, ui
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
@@ -21,9 +22,18 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
-@app.get("/health")
-async def health():
-    return {"status": "healthy", "service": "nicegui-app"}
+# NiceGUI constructs the FastAPI app, so set the default on its router: routes declared below
+# serialize their return values with orjson instead of json.dumps.
+app.router.default_response_class = ORJSONResponse
+
+
+_HEALTH_BODY = {"status": "healthy", "service": "nicegui-app"}
+
+
+@app.get("/health", responses={200: {"content": {"application/json": {"example": _HEALTH_BODY}}}})
+async def health() -> Response:
+    # Returning the response directly skips jsonable_encoder and response validation on every probe
+    return ORJSONResponse(_HEALTH_BODY)
 
 
 # suppress sqlalchemy engine logs below warning level
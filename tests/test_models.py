@@ -0,0 +1,538 @@
+"""Logic tests for model helpers that don't need a database."""
+
+from dataclasses import FrozenInstanceError
+from datetime import date, datetime
+
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+from annotated_types import MaxLen
+from pydantic import ValidationError
+from sqlalchemy import insert, inspect, update
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.dialects import postgresql
+from sqlmodel import SQLModel
+
+from app.database import _add_months, _month_partition
+from app.models import (
+    ALL_MODELS,
+    MONTHLY_PARTITIONED,
+    AppContent,
+    AppContentUpdate,
+    AuditAction,
+    AuditLog,
+    Borrowing,
+    BorrowingCreate,
+    BorrowingListItem,
+    BorrowingStatus,
+    BorrowingUpdate,
+    Equipment,
+    EquipmentAvailability,
+    EquipmentCondition,
+    EquipmentCreate,
+    EquipmentDetail,
+    EquipmentSpec,
+    EquipmentStatus,
+    EquipmentSummary,
+    EquipmentUpdate,
+    HelpTicket,
+    HelpTicketCategory,
+    HelpTicketCreate,
+    HelpTicketPriority,
+    HelpTicketStatus,
+    HelpTicketUpdate,
+    Lab,
+    LabCreate,
+    LabUpdate,
+    LabelEnumType,
+    MaintenanceRecord,
+    MaintenanceRecordCreate,
+    MaintenanceRecordUpdate,
+    MaintenanceType,
+    Notification,
+    NotificationCreate,
+    NotificationType,
+    Projection,
+    PeriodStats,
+    User,
+    UserAuth,
+    UserCreate,
+    UserRole,
+    UserSummary,
+    UserUpdate,
+    to_cents,
+    utcnow,
+    _field_change_rows,
+)
+
+
+def test_from_row_builds_instrumented_instance():
+    user = User.from_row({"id": 7, "email": "ana@lab.ac.id", "full_name": "Ana"})
+
+    assert user.id == 7
+    assert user.email == "ana@lab.ac.id"
+    assert user.role == UserRole.STUDENT  # defaults are still applied
+    state = inspect(user)
+    assert state is not None and state.transient
+
+
+def test_from_row_list_comprehension():
+    rows = [{"id": i, "name": f"Pipette {i}", "code": f"P-{i}", "category_id": 1, "lab_id": 1} for i in range(3)]
+
+    equipment = [Equipment.from_row(r) for r in rows]
+
+    assert [e.code for e in equipment] == ["P-0", "P-1", "P-2"]
+
+
+def test_from_row_matches_regular_construction():
+    row = {"id": 3, "email": "ana@lab.ac.id", "full_name": "Ana", "role": UserRole.ADMIN}
+
+    loaded = User.from_row(row)
+
+    assert loaded.model_dump(exclude={"created_at", "updated_at"}) == User(**row).model_dump(
+        exclude={"created_at", "updated_at"}
+    )
+    assert loaded.model_fields_set == set(row)
+
+
+def test_from_row_does_not_share_collections():
+    first = Equipment.from_row({"id": 1, "name": "A", "code": "A", "category_id": 1, "lab_id": 1})
+    second = Equipment.from_row({"id": 2, "name": "B", "code": "B", "category_id": 1, "lab_id": 1})
+
+    first.set_specifications({"voltage": 220})
+
+    assert second.spec_rows == []
+
+
+def test_from_row_does_not_mutate_input():
+    row = {"id": 1, "email": "ana@lab.ac.id", "full_name": "Ana"}
+
+    User.from_row(row)
+
+    assert row == {"id": 1, "email": "ana@lab.ac.id", "full_name": "Ana"}
+
+
+def test_create_schema_still_validates():
+    with pytest.raises(ValidationError):
+        UserCreate.model_validate({"email": "ana@lab.ac.id", "password": "short", "full_name": "Ana"})
+
+
+@pytest.mark.parametrize("email", ["not-an-email", "a@b", "a b@lab.ac.id", "ana@lab.ac.id\n", "@lab.ac.id"])
+def test_user_create_rejects_invalid_email(email: str):
+    with pytest.raises(ValidationError):
+        UserCreate.model_validate({"email": email, "password": "longenough", "full_name": "Ana"})
+
+
+def test_user_create_accepts_valid_email():
+    user = UserCreate.model_validate(
+        {"email": "ana.putri+lab@chem.ui.ac.id", "password": "longenough", "full_name": "Ana"}
+    )
+
+    assert user.email == "ana.putri+lab@chem.ui.ac.id"
+
+
+def test_user_update_email_is_optional_but_checked():
+    assert UserUpdate.model_validate({}).email is None
+    with pytest.raises(ValidationError):
+        UserUpdate.model_validate({"email": "nope"})
+
+
+def test_update_schema_rejects_unknown_fields():
+    with pytest.raises(ValidationError):
+        EquipmentUpdate(statuss="available")  # type: ignore[call-arg]
+
+    assert EquipmentUpdate(status="available").model_dump(exclude_unset=True) == {  # type: ignore[arg-type]
+        "status": EquipmentStatus.AVAILABLE
+    }
+
+
+def test_enum_parses_labels_and_ints():
+    assert UserRole("head_lab") is UserRole.HEAD_LAB
+    assert UserRole(UserRole.LECTURER.value) is UserRole.LECTURER
+    assert BorrowingStatus.APPROVED_LABORAN.label == "approved_laboran"
+
+
+def test_enums_are_stored_as_smallint_and_dumped_as_labels():
+    column = User.__table__.columns["role"]  # type: ignore[attr-defined]
+    user = UserCreate(email="ana@lab.ac.id", password="longenough", full_name="Ana", role=UserRole.HEAD_LAB)
+
+    assert isinstance(column.type, LabelEnumType)
+    assert column.type.process_bind_param("lecturer", postgresql.dialect()) == UserRole.LECTURER.value
+    assert column.type.process_result_value(2, postgresql.dialect()) is UserRole.HEAD_LAB
+    assert user.model_dump(mode="json")["role"] == "head_lab"
+    assert user.model_dump()["role"] is UserRole.HEAD_LAB
+
+
+def test_schema_accepts_enum_label():
+    user = UserCreate.model_validate(
+        {"email": "ana@lab.ac.id", "password": "longenough", "full_name": "Ana", "role": "lecturer"}
+    )
+
+    assert user.role is UserRole.LECTURER
+
+
+def test_schema_rejects_unknown_enum_label():
+    with pytest.raises(ValidationError):
+        UserUpdate.model_validate({"role": "janitor"})
+
+
+def test_stats_records_are_frozen_and_slotted():
+    stats = PeriodStats("2024-01", 10, 8, 1, 0, 6, 4)
+
+    assert not hasattr(stats, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        stats.total_borrowings = 11  # type: ignore[misc]
+    assert stats.to_dict()["unique_equipment"] == 4
+
+
+def test_utcnow_is_naive_utc():
+    assert utcnow().tzinfo is None
+
+
+def test_money_is_stored_in_cents():
+    equipment = Equipment(name="Balance", code="B-1", category_id=1, lab_id=1, purchase_price_cents=1_250_075)
+
+    assert equipment.purchase_price == Decimal("12500.75")
+    assert Equipment(name="B", code="B-2", category_id=1, lab_id=1, purchase_price_cents=None).purchase_price is None
+
+
+def test_create_schema_does_not_share_mutable_defaults():
+    first = EquipmentCreate(name="Balance", code="B-1", category_id=1, lab_id=1)
+    second = EquipmentCreate(name="Balance", code="B-2", category_id=1, lab_id=1)
+
+    first.specifications["voltage"] = 220
+
+    assert second.specifications == {}
+
+
+def test_money_schemas_convert_to_cents():
+    data = EquipmentCreate(name="Balance", code="B-1", category_id=1, lab_id=1, purchase_price=Decimal("12500.75"))
+
+    equipment = Equipment.model_validate(data.model_dump())
+    assert equipment.purchase_price_cents == 1_250_075
+    equipment.sqlmodel_update({"purchase_price": Decimal("12.50")})
+
+    assert equipment.purchase_price_cents == 1250
+    assert to_cents(Decimal("0.005")) == 1
+    with pytest.raises(ValidationError):
+        MaintenanceRecordUpdate(cost=Decimal("10.999"))
+
+
+def test_money_reaches_the_cents_column_on_every_schema_path():
+    data = MaintenanceRecordCreate(
+        equipment_id=1,
+        maintenance_type=MaintenanceType.PREVENTIVE,
+        scheduled_date=datetime(2026, 1, 5),
+        description="oil",
+        cost=Decimal("3.10"),
+    )
+    record = MaintenanceRecord(**data.model_dump())
+    assert record.cost_cents == 310
+
+    record.sqlmodel_update(MaintenanceRecordUpdate(cost=Decimal("9.99")))
+    assert record.cost_cents == 999
+    record.sqlmodel_update(MaintenanceRecordUpdate(notes="done").model_dump(exclude_unset=True))
+    assert record.cost_cents == 999  # fields left out of an update keep their value
+
+
+def test_description_from_schema_goes_to_the_detail_row():
+    data = EquipmentCreate(name="Flask", code="F-1", category_id=1, lab_id=1, description="fragile glass")
+
+    for equipment in (Equipment(**data.model_dump()), Equipment.model_validate(data.model_dump())):
+        assert equipment.detail is not None and equipment.detail.description == "fragile glass"
+    detail = equipment.detail
+    equipment.sqlmodel_update(EquipmentUpdate(description="handle with care"))
+    equipment.sqlmodel_update(EquipmentUpdate(name="Flask 2").model_dump(exclude_unset=True))
+
+    assert equipment.detail is detail and detail.description == "handle with care"
+    assert Equipment(**data.model_dump(exclude={"description"})).detail is None
+
+
+def test_label_fields_resolve_to_members():
+    notification = NotificationCreate.model_validate(
+        {"user_id": 1, "type": "equipment_overdue", "title": "Overdue", "message": "..."}
+    )
+
+    assert notification.type is NotificationType.EQUIPMENT_OVERDUE
+    assert BorrowingUpdate.model_validate({"status": "checked_out"}).status is BorrowingStatus.CHECKED_OUT
+    assert BorrowingUpdate.model_validate({"status": BorrowingStatus.OVERDUE.value}).status is BorrowingStatus.OVERDUE
+    with pytest.raises(ValidationError):
+        BorrowingUpdate.model_validate({"status": "lost"})
+
+
+def test_every_enum_field_parses_and_documents_labels():
+    log = AuditLog.model_validate({"action": "checkout", "entity_type": "borrowing"})
+    schema = HelpTicketUpdate.model_json_schema()["properties"]["status"]["anyOf"][0]
+
+    assert log.action is AuditAction.CHECKOUT
+    assert schema["enum"] == ["open", "in_progress", "resolved", "closed"]
+
+
+def test_small_vocabulary_fields_are_enums():
+    ticket = HelpTicketCreate.model_validate({"subject": "Locked out", "message": "...", "category": "password_reset"})
+
+    assert ticket.priority is HelpTicketPriority.NORMAL
+    assert ticket.category is HelpTicketCategory.PASSWORD_RESET
+    assert HelpTicketUpdate.model_validate({"status": "in_progress"}).status is HelpTicketStatus.IN_PROGRESS
+    assert EquipmentUpdate.model_validate({"condition": "poor"}).condition is EquipmentCondition.POOR
+    with pytest.raises(ValidationError):
+        EquipmentCreate.model_validate(
+            {"name": "Burette", "code": "B1", "category_id": 1, "lab_id": 1, "condition": "broken"}
+        )
+
+
+@pytest.mark.parametrize("projection", [UserSummary, EquipmentSummary, BorrowingListItem])
+def test_projection_selects_only_its_own_fields(projection):
+    selected = [c.name for c in projection.statement().selected_columns]
+
+    assert selected == list(projection.model_fields)
+    assert "password_hash" not in selected
+
+
+def test_projection_without_statement_fails_at_definition():
+    with pytest.raises(TypeError, match="statement"):
+
+        class NameOnly(Projection):
+            name: str
+
+
+def test_projection_dumps_skip_none_fields():
+    item = EquipmentSummary.model_construct(
+        id=1,
+        name="Burette",
+        code="B1",
+        lab_id=1,
+        category_id=2,
+        status=EquipmentStatus.AVAILABLE,
+        condition=EquipmentCondition.GOOD,
+        image_path=None,
+        next_maintenance=datetime(2026, 3, 1),
+    )
+
+    assert "image_path" not in item.model_dump()
+    assert item.model_dump()["next_maintenance"] == "2026-03-01T00:00:00"
+    assert '"image_path"' not in item.model_dump_json()
+    assert item.model_dump(exclude_none=False)["image_path"] is None
+
+
+def test_audit_log_records_only_changed_fields():
+    log = AuditLog(action=AuditAction.UPDATE, entity_type="equipment", entity_id=5)
+
+    log.record_changes(
+        {"name": "Burette", "condition": "good", "serial_number": "X1"},
+        {"name": "Burette", "condition": "poor", "lab_id": 2},
+    )
+
+    assert [c.field_name for c in log.changes] == ["condition", "serial_number", "lab_id"]
+    assert {c.entity_type for c in log.changes} == {"equipment"}
+    assert log.old_values == {"condition": "good", "serial_number": "X1", "lab_id": None}
+    assert log.new_values == {"condition": "poor", "serial_number": None, "lab_id": 2}
+
+
+def test_bulk_log_returns_partition_keys_and_builds_child_rows():
+    created = datetime(2026, 10, 1)
+    rows = [
+        {"action": AuditAction.UPDATE, "entity_type": "equipment", "old": {"status": 1}, "new": {"status": 2}},
+        {"action": AuditAction.CREATE, "entity_type": "lab"},
+        {"action": AuditAction.UPDATE, "entity_type": "user", "old": {"a": 1, "b": 2}, "new": {"a": 1, "b": 3}},
+    ]
+
+    sql = str(AuditLog._insert_returning_keys().compile(dialect=postgresql.dialect()))
+    changes = _field_change_rows([(10, created), (11, created), (12, created)], rows)
+
+    assert sql.endswith("RETURNING audit_logs.id, audit_logs.created_at")
+    assert changes == [
+        {
+            "audit_log_id": 10,
+            "created_at": created,
+            "entity_type": "equipment",
+            "field_name": "status",
+            "old_value": 1,
+            "new_value": 2,
+        },
+        {
+            "audit_log_id": 12,
+            "created_at": created,
+            "entity_type": "user",
+            "field_name": "b",
+            "old_value": 2,
+            "new_value": 3,
+        },
+    ]
+
+
+def test_availability_overlap_is_an_integer_range_query():
+    stmt = EquipmentAvailability.overlapping(3, datetime(2026, 1, 5), 540, 600)
+    sql = str(stmt.compile(compile_kwargs={"literal_binds": True}))
+
+    assert "equipment_availability.start_min < 600" in sql
+    assert "equipment_availability.end_min > 540" in sql
+
+
+def test_updated_at_is_stamped_by_the_database_on_update():
+    sql = str(update(Equipment).values(name="Burette").compile())
+
+    assert "updated_at=timezone(" in sql and "now()" in sql
+
+
+def test_timestamps_are_left_to_the_database_on_insert():
+    sql = str(insert(Equipment).values(name="Burette", code="B1", category_id=1, lab_id=1).compile())
+
+    assert "created_at" not in sql and "updated_at" not in sql
+    assert Equipment.__table__.columns["created_at"].server_default is not None  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("model", MONTHLY_PARTITIONED)
+def test_monthly_partitioned_tables_are_keyed_by_created_at(model):
+    table = model.__table__
+    ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+
+    assert "PARTITION BY RANGE (created_at)" in ddl
+    assert [c.name for c in table.primary_key] == ["id", "created_at"]
+
+
+def test_month_partition_is_named_and_bounded_by_its_month():
+    assert _month_partition("audit_logs", date(2026, 3, 17)) == (
+        "audit_logs_2026_03",
+        date(2026, 3, 1),
+        date(2026, 4, 1),
+    )
+
+
+def test_month_partition_after_december_rolls_over_to_january():
+    assert _month_partition("notifications", date(2026, 12, 31)) == (
+        "notifications_2026_12",
+        date(2026, 12, 1),
+        date(2027, 1, 1),
+    )
+    assert _add_months(date(2026, 12, 1), 1) == date(2027, 1, 1)
+    assert _add_months(date(2027, 1, 1), -6) == date(2026, 7, 1)
+
+
+@pytest.mark.parametrize("model", [AuditLog, Notification])
+def test_recent_bounds_created_at_so_old_partitions_are_pruned(model):
+    sql = str(model.recent(datetime(2026, 1, 1)).compile(compile_kwargs={"literal_binds": True}))
+
+    assert f"WHERE {model.__tablename__}.created_at >= '2026-01-01 00:00:00'" in sql
+
+
+def test_relationships_never_lazy_load_implicitly():
+    strategies = {rel.lazy for model in ALL_MODELS for rel in inspect(model).relationships}
+
+    assert strategies <= {"raise_on_sql", "selectin"}
+
+
+def test_only_many_to_one_references_load_eagerly():
+    eager = {str(rel) for model in ALL_MODELS for rel in inspect(model).relationships if rel.lazy == "selectin"}
+
+    assert eager == {"LabMember.lab", "Borrowing.user", "Borrowing.equipment"}
+
+
+def test_timestamp_fields_are_optional_until_flush_but_columns_are_not_null():
+    timestamps = [
+        (model, name)
+        for model in ALL_MODELS
+        for name in ("created_at", "updated_at", "joined_at")
+        if name in model.model_fields
+    ]
+
+    assert timestamps
+    for model, name in timestamps:
+        assert model.model_fields[name].annotation == Optional[datetime], f"{model.__name__}.{name}"
+        assert not model.__table__.columns[name].nullable, f"{model.__name__}.{name}"  # type: ignore[attr-defined]
+
+
+def test_all_models_lists_every_table_and_mappers_are_configured_at_import():
+    assert {model.__tablename__ for model in ALL_MODELS} == set(SQLModel.metadata.tables)
+    assert all(inspect(model).configured for model in ALL_MODELS)
+
+
+@pytest.mark.parametrize(
+    "schema, model",
+    [
+        (UserCreate, User),
+        (UserUpdate, User),
+        (LabCreate, Lab),
+        (LabUpdate, Lab),
+        (EquipmentCreate, Equipment),
+        (EquipmentUpdate, Equipment),
+        (EquipmentCreate, EquipmentDetail),
+        (EquipmentUpdate, EquipmentDetail),
+        (BorrowingCreate, Borrowing),
+        (BorrowingUpdate, Borrowing),
+        (NotificationCreate, Notification),
+        (MaintenanceRecordCreate, MaintenanceRecord),
+        (MaintenanceRecordUpdate, MaintenanceRecord),
+        (HelpTicketCreate, HelpTicket),
+        (HelpTicketUpdate, HelpTicket),
+        (AppContentUpdate, AppContent),
+    ],
+)
+def test_schema_length_limits_match_column_lengths(schema, model):
+    columns = model.__table__.columns  # type: ignore[attr-defined]
+    for name, field in schema.model_fields.items():
+        if name not in columns or field.annotation not in (str, str | None):
+            continue
+        max_length = next((m.max_length for m in field.metadata if isinstance(m, MaxLen)), None)
+        length = getattr(columns[name].type, "length", None)
+        # TEXT columns leave the limit to the schema; bounded columns must agree with it
+        assert length is None or max_length == length, f"{schema.__name__}.{name}"
+
+
+def test_specifications_are_typed_rows():
+    equipment = Equipment(name="Hot plate", code="HP1", category_id=1, lab_id=1)
+
+    equipment.set_specifications({"voltage": 220, "portable": True, "brand": "Acme"})
+    voltage = equipment.spec_rows[0]
+    equipment.set_specifications({"voltage": 230.5})
+
+    assert equipment.spec_rows == [voltage]  # existing keys are updated in place
+    assert (voltage.value_num, voltage.value_text, voltage.value_bool) == (Decimal("230.5"), None, None)
+    assert equipment.specifications == {"voltage": Decimal("230.5")}
+
+
+def test_specifications_from_schema_become_spec_rows():
+    data = EquipmentCreate(name="Hot plate", code="HP1", category_id=1, lab_id=1, specifications={"voltage": 220})
+
+    for equipment in (
+        Equipment(**data.model_dump()),
+        Equipment.model_validate(data),
+        Equipment.model_validate(data.model_dump()),
+    ):
+        assert [(spec.key, spec.value_num) for spec in equipment.spec_rows] == [("voltage", Decimal("220"))]
+
+    equipment.sqlmodel_update(EquipmentUpdate(specifications={"voltage": 230, "portable": True}))
+    assert equipment.specifications == {"voltage": Decimal("230"), "portable": True}
+    equipment.sqlmodel_update(EquipmentUpdate(name="Stirrer").model_dump(exclude_unset=True))
+    assert equipment.specifications == {"voltage": Decimal("230"), "portable": True}
+
+
+def test_specification_filter_matches_typed_value_column():
+    sql = str(Equipment.with_specifications({"voltage": 220, "portable": True}).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("EXISTS (SELECT 1") == 2
+    assert "equipment_specs.value_num = " in sql and "equipment_specs.value_bool = " in sql
+
+
+def test_specification_filter_for_none_requires_empty_value():
+    sql = str(EquipmentSpec.matches("calibrated_by", None).compile(dialect=postgresql.dialect()))
+
+    assert "value_text IS NULL" in sql and "value_num IS NULL" in sql and "value_bool IS NULL" in sql
+
+
+@pytest.mark.parametrize("value", [[0, 100], {"min": 0, "max": 100}])
+def test_nested_specification_values_are_rejected(value):
+    with pytest.raises(TypeError):
+        EquipmentSpec(key="range").value = value  # type: ignore[call-arg]
+    with pytest.raises(ValidationError):
+        EquipmentCreate(name="Hot plate", code="HP1", category_id=1, lab_id=1, specifications={"range": value})
+
+
+def test_cold_columns_live_in_one_to_one_tables():
+    user = User(email="ana@lab.ac.id", full_name="Ana")
+    user.auth = UserAuth(password_hash="x")  # type: ignore[call-arg]
+
+    assert "password_hash" not in User.__table__.columns  # type: ignore[attr-defined]
+    assert {"description", "manual_document"}.isdisjoint(Equipment.__table__.columns.keys())  # type: ignore[attr-defined]
+    assert user.auth.user is user
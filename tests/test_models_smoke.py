@@ -1,11 +1,17 @@
 """Smoke test for SQLModel database setup."""
 
+from datetime import date, datetime
+from decimal import Decimal
+
 import pytest
-from sqlmodel import SQLModel, text
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.orm import selectinload
+from sqlmodel import SQLModel, Session, col, text
 import os
 
-from app.database import create_tables, ENGINE
+from app.database import _add_months, create_month_partitions, create_tables, drop_month_partitions, ENGINE
 from app import models
+from app.content_cache import CONTENT_CACHE_SIZE, CONTENT_TTL, cached_content, clear_content_cache
 
 
 @pytest.mark.sqlmodel
@@ -28,6 +34,234 @@ def test_sqlmodel_smoke():
         assert table_name in db_tables, f"Table '{table_name}' not found in database"
 
 
+@pytest.fixture
+def statements():
+    """(statement, executemany) for every statement sent to the database while the test runs."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append((statement, executemany))
+
+    event.listen(ENGINE, "before_cursor_execute", record)
+    yield seen
+    event.remove(ENGINE, "before_cursor_execute", record)
+
+
+@pytest.mark.sqlmodel
+def test_bulk_create_issues_one_multi_row_insert(statements):
+    create_tables()
+    statements.clear()
+    with Session(ENGINE) as session:
+        models.EquipmentCategory.bulk_create(session, [])
+        assert statements == []
+
+        models.EquipmentCategory.bulk_create(session, [{"name": f"bulk-{i}"} for i in range(3)])
+        session.rollback()
+
+    [(statement, executemany)] = [s for s in statements if s[0].startswith("INSERT")]
+    assert executemany
+    assert statement.startswith("INSERT INTO equipment_categories")
+    assert statement.count("), (") == 2  # all three rows in one VALUES list
+
+
+@pytest.mark.sqlmodel
+def test_bulk_log_attaches_changes_to_their_own_log():
+    create_tables()
+    rows = [
+        {
+            "action": models.AuditAction.UPDATE,
+            "entity_type": "equipment",
+            "entity_id": entity_id,
+            "old": {"name": "before"},
+            "new": {"name": f"after-{entity_id}"},
+        }
+        for entity_id in range(5)
+    ]
+    with Session(ENGINE) as session:
+        models.AuditLog.bulk_log(session, rows)
+        pairs = session.execute(
+            select(col(models.AuditLog.entity_id), col(models.AuditLogFieldChange.new_value))
+            .join(models.AuditLogFieldChange)
+            .where(col(models.AuditLog.entity_type) == "equipment")
+        ).all()
+        session.rollback()
+
+    assert sorted(pairs) == [(entity_id, f"after-{entity_id}") for entity_id in range(5)]
+
+
+@pytest.mark.sqlmodel
+def test_equipment_schema_fields_are_stored():
+    create_tables()
+    with Session(ENGINE) as session:
+        lab = models.Lab(name="Schema lab", code="SCHEMA-TEST", location="B1")
+        category = models.EquipmentCategory(name="Glassware")
+        session.add_all([lab, category])
+        session.flush()
+        assert lab.id is not None and category.id is not None
+        data = models.EquipmentCreate(
+            name="Burette",
+            code="SCHEMA-TEST-1",
+            category_id=category.id,
+            lab_id=lab.id,
+            description="50 ml",
+            specifications={"volume_ml": 50},
+            purchase_price=Decimal("12.50"),
+        )
+        session.add(models.Equipment.model_validate(data))
+        session.flush()
+        session.expire_all()
+
+        loaded = session.scalars(
+            select(models.Equipment)
+            .where(col(models.Equipment.code) == "SCHEMA-TEST-1")
+            .options(selectinload(models.Equipment.detail), selectinload(models.Equipment.spec_rows))  # type: ignore[arg-type]
+        ).one()
+        loaded.sqlmodel_update(models.EquipmentUpdate(description="25 ml", specifications={"volume_ml": 25}))
+        session.flush()
+        session.expire_all()
+
+        row = session.execute(
+            select(col(models.Equipment.purchase_price_cents), col(models.EquipmentDetail.description))
+            .join(models.EquipmentDetail)
+            .where(col(models.Equipment.code) == "SCHEMA-TEST-1")
+        ).one()
+        specs = session.execute(
+            select(col(models.EquipmentSpec.key), col(models.EquipmentSpec.value_num)).where(
+                col(models.EquipmentSpec.equipment_id) == loaded.id
+            )
+        ).all()
+        session.rollback()
+
+    assert tuple(row) == (1250, "25 ml")
+    assert [tuple(spec) for spec in specs] == [("volume_ml", Decimal("25"))]
+
+
+@pytest.mark.sqlmodel
+def test_month_partition_takes_over_rows_from_the_default_partition():
+    create_tables()
+    month = date(2000, 1, 1)
+    drop_month_partitions(_add_months(month, 1))  # leftovers of an interrupted run
+    with Session(ENGINE) as session:
+        models.AuditLog.bulk_log(
+            session,
+            [
+                {
+                    "action": models.AuditAction.UPDATE,
+                    "entity_type": "partition-test",
+                    "created_at": datetime(2000, 1, day),
+                    "old": {"name": "before"},
+                    "new": {"name": "after"},
+                }
+                for day in (1, 31)
+            ],
+        )
+        session.commit()
+
+    create_month_partitions(month)
+
+    homes = text(
+        "SELECT tableoid::regclass::text FROM audit_logs WHERE entity_type = 'partition-test' "
+        "UNION ALL SELECT tableoid::regclass::text FROM audit_log_field_changes WHERE entity_type = 'partition-test'"
+    )
+    with Session(ENGINE) as session:
+        assert sorted(session.execute(homes).scalars()) == 2 * ["audit_log_field_changes_2000_01"] + 2 * [
+            "audit_logs_2000_01"
+        ]
+        logs = session.scalars(
+            models.AuditLog.recent(datetime(2000, 1, 1)).options(selectinload(models.AuditLog.changes))  # type: ignore[arg-type]
+        ).all()
+        assert [log.new_values for log in logs if log.entity_type == "partition-test"] == 2 * [{"name": "after"}]
+
+    drop_month_partitions(_add_months(month, 1))
+
+    with Session(ENGINE) as session:
+        assert session.execute(homes).all() == []
+        assert session.execute(text("SELECT to_regclass('audit_logs_2000_01')")).scalar() is None
+        assert session.execute(text("SELECT to_regclass('audit_logs_default')")).scalar() is not None
+
+
+@pytest.fixture
+def empty_content_cache():
+    """Empty AppContent cache; content rows the test adds under "cache-test" keys are removed afterwards."""
+    create_tables()
+    clear_content_cache()
+    yield
+    clear_content_cache()
+    with Session(ENGINE) as session:
+        session.execute(delete(models.AppContent).where(col(models.AppContent.key).startswith("cache-test")))
+        session.commit()
+
+
+@pytest.mark.sqlmodel
+def test_cached_content_is_served_until_it_expires(empty_content_cache):
+    with Session(ENGINE) as session:
+        session.add(models.AppContent(key="cache-test", content="v1"))
+        session.commit()
+        assert cached_content(session, "cache-test", now=1000.0) == "v1"
+
+        # Core UPDATEs bypass eviction, so the cached value stands until the TTL runs out
+        session.execute(update(models.AppContent).values(content="v2"))
+        session.commit()
+        assert cached_content(session, "cache-test", now=1000.0 + CONTENT_TTL - 1) == "v1"
+        assert cached_content(session, "cache-test", now=1000.0 + CONTENT_TTL + 1) == "v2"
+
+
+@pytest.mark.sqlmodel
+def test_cached_content_is_evicted_when_the_writing_transaction_ends(empty_content_cache):
+    now = 1000.0
+    with Session(ENGINE) as writer, Session(ENGINE) as reader:
+        content = models.AppContent(key="cache-test", content="v1")
+        writer.add(content)
+        writer.commit()
+        assert cached_content(reader, "cache-test", now) == "v1"
+
+        content.content = "v2"
+        writer.flush()
+        reader.rollback()
+        assert cached_content(reader, "cache-test", now) == "v1"
+        writer.commit()
+        reader.rollback()
+        assert cached_content(reader, "cache-test", now) == "v2"
+
+        content.content = "uncommitted"
+        writer.flush()
+        assert cached_content(writer, "cache-test", now + CONTENT_TTL + 1) == "uncommitted"
+        writer.rollback()
+        assert cached_content(writer, "cache-test", now + CONTENT_TTL + 1) == "v2"
+
+        content.key = "cache-test-renamed"
+        writer.commit()
+        assert cached_content(reader, "cache-test", now + CONTENT_TTL + 1) is None
+
+
+@pytest.mark.sqlmodel
+def test_uncommitted_content_is_evicted_when_the_session_closes(empty_content_cache):
+    with Session(ENGINE) as session:
+        session.add(models.AppContent(key="cache-test", content="draft"))
+        session.flush()
+        assert cached_content(session, "cache-test", now=1000.0) == "draft"
+
+    with Session(ENGINE) as session:
+        assert cached_content(session, "cache-test", now=1000.0) is None
+
+
+@pytest.mark.sqlmodel
+def test_content_cache_is_cleared_when_full(empty_content_cache):
+    with Session(ENGINE) as session:
+        session.add(models.AppContent(key="cache-test", content="v1"))
+        session.commit()
+        assert cached_content(session, "cache-test", now=1000.0) == "v1"
+        session.execute(update(models.AppContent).values(content="v2"))
+        session.commit()
+
+        for i in range(CONTENT_CACHE_SIZE - 1):
+            cached_content(session, f"cache-test-missing-{i}", now=1000.0)
+        assert cached_content(session, "cache-test", now=1000.0) == "v1"  # still cached: the cache is just full
+
+        cached_content(session, "cache-test-one-more", now=1000.0)
+        assert cached_content(session, "cache-test", now=1000.0) == "v2"
+
+
 DATABRICKS_HOST = os.environ.get("DATABRICKS_HOST")
 DATABRICKS_TOKEN = os.environ.get("DATABRICKS_TOKEN")
 